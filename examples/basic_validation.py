@@ -39,12 +39,14 @@ def main():
             SELECT customer_id, total_amount, items_count
             FROM orders
             WHERE created_at >= '{start_date}'
+            ORDER BY customer_id
         """
         
         target_query = """
             SELECT customer_id, total_amount, items_count
             FROM orders
             WHERE created_at >= '{start_date}'
+            ORDER BY customer_id
         """
         
         # Run validation
@@ -1,3 +1,4 @@
+import os
 from pydantic import BaseSettings, Field
 from typing import Optional
 
@@ -7,6 +8,11 @@ class DatabaseSettings(BaseSettings):
     database: str = Field(..., env="DB_NAME")
     user: str = Field(..., env="DB_USER")
     password: str = Field(..., env="DB_PASSWORD")
+    pool_size: int = Field(os.cpu_count() or 4, env="DB_POOL_SIZE")
+    # Read through ConnectorX instead of psycopg (needs connectorx installed)
+    use_connectorx: bool = Field(False, env="DB_USE_CONNECTORX")
+    # Numeric column ConnectorX may split large scans on (optional)
+    partition_on: Optional[str] = Field(None, env="DB_PARTITION_ON")
     
     class Config:
         env_prefix = 'DB_'
@@ -14,6 +20,8 @@ class DatabaseSettings(BaseSettings):
 class DuckDBSettings(BaseSettings):
     file_path: str = Field(..., env="DUCKDB_FILE_PATH")
     download_path: str = Field(..., env="DUCKDB_DOWNLOAD_PATH")
+    pool_size: int = Field(os.cpu_count() or 4, env="DUCKDB_POOL_SIZE")
+    threads: Optional[int] = Field(None, env="DUCKDB_THREADS")
     
     class Config:
         env_prefix = 'DUCKDB_'
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, Iterator, List
 
 class DatabaseConnector(ABC):
     @abstractmethod
@@ -13,6 +13,16 @@ class DatabaseConnector(ABC):
         """Execute query and return results as DataFrame."""
         pass
     
+    @abstractmethod
+    def execute_query_iter(
+        self,
+        query: str,
+        params: Optional[Dict] = None,
+        batch_size: int = 25000
+    ) -> Iterator[pd.DataFrame]:
+        """Execute query and yield results as DataFrames of at most batch_size rows."""
+        pass
+    
     @abstractmethod
     def close(self) -> None:
         """Close database connection."""
@@ -1,31 +1,196 @@
 import ibis
+import queue
+import threading
+from contextlib import contextmanager
 from .base import DatabaseConnector
 from ..config.settings import DuckDBSettings
 import pandas as pd
-from typing import Optional, Dict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 from ..core.exceptions import DatabaseError
 
+class DuckDBConnectionPool:
+    """Bounded pool of ibis DuckDB connections to a single database.
+
+    Connections are opened lazily up to ``size`` and handed out for
+    exclusive use; callers block for up to ``timeout`` seconds when all of
+    them are checked out. Streaming queries only borrow a connection long
+    enough to open a cursor on it, so they never hold one while iterating.
+    """
+    def __init__(self, factory: Callable[[], Any], size: int, timeout: float = 30.0):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self.users = 0
+        self._factory = factory
+        self._idle = queue.Queue(maxsize=self.size)
+        self._all = []
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Check out a connection, returning it to the pool on exit."""
+        connection = self._checkout()
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+    
+    def _checkout(self) -> Any:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if len(self._all) < self.size:
+                connection = self._factory()
+                self._all.append(connection)
+                return connection
+        
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise DatabaseError(f"Timed out waiting for one of {self.size} DuckDB connections")
+    
+    def close(self) -> None:
+        with self._lock:
+            for connection in self._all:
+                # ibis >= 9 renamed Backend.close() to disconnect()
+                (getattr(connection, 'disconnect', None) or connection.close)()
+            self._all.clear()
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+# Pools are shared by every connector with the same settings so repeated
+# validation runs don't pay connection and extension setup again
+_POOLS: Dict[Tuple, DuckDBConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
 class DuckDBConnector(DatabaseConnector):
     def __init__(self, settings: DuckDBSettings):
         self.settings = settings
-        self.connection = None
+        self.pool = None
+        self._local = threading.local()
+    
+    def _pool_key(self) -> Tuple:
+        return (self.settings.file_path, self.settings.pool_size, self.settings.threads)
+    
+    def _open_connection(self):
+        config = {}
+        if self.settings.threads:
+            config['threads'] = self.settings.threads
+        return ibis.duckdb.connect(database=self.settings.file_path, **config)
     
     def connect(self):
         try:
-            self.connection = ibis.duckdb.connect(database=self.settings.file_path)
-            return self.connection
+            if self.settings.file_path == ':memory:':
+                # Every in-memory connection is a separate database, so keep a private one
+                pool = DuckDBConnectionPool(self._open_connection, 1)
+            else:
+                with _POOLS_LOCK:
+                    pool = _POOLS.setdefault(
+                        self._pool_key(),
+                        DuckDBConnectionPool(self._open_connection, self.settings.pool_size)
+                    )
+            with _POOLS_LOCK:
+                pool.users += 1
+            self.pool = pool
+            # Open the first connection eagerly so bad settings fail here
+            with self.acquire():
+                pass
+            return self.pool
         except Exception as e:
             raise DatabaseError(f"Failed to connect to DuckDB: {str(e)}")
     
+    @contextmanager
+    def acquire(self) -> Iterator[Any]:
+        """Hold one pooled connection for the current thread.
+
+        Nested ``acquire`` calls in the same thread reuse the held connection,
+        which keeps connection-scoped state such as temporary tables visible
+        across several queries.
+        """
+        held = getattr(self._local, 'connection', None)
+        if held is not None:
+            yield held
+            return
+        with self.pool.connection() as connection:
+            self._local.connection = connection
+            try:
+                yield connection
+            finally:
+                self._local.connection = None
+    
     def execute_query(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
         try:
             if params:
                 query = query.format(**params)
-            result = self.connection.sql(query).execute()
-            return pd.DataFrame(result)
+            with self.acquire() as connection:
+                # Fetch as Arrow and convert once, skipping the intermediate pandas copy
+                table = connection.sql(query).to_pyarrow()
+            return table.to_pandas(split_blocks=True, self_destruct=True)
         except Exception as e:
             raise DatabaseError(f"Failed to execute DuckDB query: {str(e)}")
     
+    def execute_query_iter(
+        self,
+        query: str,
+        params: Optional[Dict] = None,
+        batch_size: int = 25000
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            if params:
+                query = query.format(**params)
+            # Stream on a cursor of its own so concurrent queries can't cut it short;
+            # the pooled connection goes back right away, so interleaved streams
+            # (e.g. source and target of one validation) never wait on each other
+            with self.acquire() as connection:
+                cursor = connection.con.cursor()
+            try:
+                result = cursor.execute(query)
+                # duckdb >= 1.4 renamed fetch_record_batch() to to_arrow_reader()
+                fetch = getattr(result, 'to_arrow_reader', None) or result.fetch_record_batch
+                for batch in fetch(batch_size):
+                    yield batch.to_pandas()
+            finally:
+                cursor.close()
+        except Exception as e:
+            raise DatabaseError(f"Failed to execute DuckDB query: {str(e)}")
+    
+    def register_dataframe(self, name: str, data: pd.DataFrame) -> None:
+        """Expose a DataFrame to subsequent queries as a temporary table.
+
+        Temporary tables belong to a single connection, so register and query
+        inside one ``acquire()`` block.
+        """
+        view = f"{name}_source"
+        try:
+            with self.acquire() as connection:
+                # Scan the frame in place and copy it into a connection-local table
+                connection.con.register(view, data)
+                try:
+                    connection.con.execute(
+                        f"CREATE OR REPLACE TEMP TABLE {_quote(name)} AS SELECT * FROM {_quote(view)}"
+                    )
+                finally:
+                    connection.con.unregister(view)
+        except Exception as e:
+            raise DatabaseError(f"Failed to register DataFrame in DuckDB: {str(e)}")
+    
+    def unregister_dataframe(self, name: str) -> None:
+        """Drop a table created by ``register_dataframe``."""
+        try:
+            with self.acquire() as connection:
+                connection.con.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+        except Exception as e:
+            raise DatabaseError(f"Failed to unregister DataFrame in DuckDB: {str(e)}")
+    
     def close(self):
-        if self.connection:
-            self.connection.close()
+        if self.pool:
+            with _POOLS_LOCK:
+                self.pool.users -= 1
+                if self.pool.users == 0:
+                    if _POOLS.get(self._pool_key()) is self.pool:
+                        del _POOLS[self._pool_key()]
+                    self.pool.close()
+            self.pool = None
@@ -1,39 +1,115 @@
-import ibis
+import os
+from urllib.parse import quote
+from psycopg import Connection, Cursor
+from psycopg.conninfo import make_conninfo
+from psycopg_pool import ConnectionPool
 from .base import DatabaseConnector
 from ..config.settings import DatabaseSettings
 import pandas as pd
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator
 from ..core.exceptions import DatabaseError
 
+try:
+    import connectorx as cx
+except ImportError:  # connectorx is optional; fall back to a pooled cursor
+    cx = None
+
 class PostgresConnector(DatabaseConnector):
     def __init__(self, settings: DatabaseSettings):
         self.settings = settings
-        self.connection = None
+        self.conninfo = None
+        self.pool = None
+    
+    @staticmethod
+    def _configure(connection: Connection) -> None:
+        # Applies to every transaction on the connection, not just the next one
+        connection.read_only = True
     
     def connect(self):
         try:
-            self.connection = ibis.postgres.connect(
+            if self.settings.use_connectorx and cx is None:
+                raise DatabaseError("DB_USE_CONNECTORX is set but connectorx is not installed")
+            self.conninfo = make_conninfo(
                 host=self.settings.host,
                 port=self.settings.port,
                 user=self.settings.user,
                 password=self.settings.password,
-                database=self.settings.database
+                dbname=self.settings.database
+            )
+            self.pool = ConnectionPool(
+                self.conninfo,
+                min_size=1,
+                max_size=self.settings.pool_size,
+                configure=self._configure,
+                open=True
             )
-            self.connection.raw_sql('SET TRANSACTION READ ONLY;')
-            return self.connection
+            self.pool.wait()
+            return self.pool
         except Exception as e:
             raise DatabaseError(f"Failed to connect to PostgreSQL: {str(e)}")
     
+    @staticmethod
+    def _to_frame(cursor: Cursor) -> pd.DataFrame:
+        rows = cursor.fetchall()
+        return pd.DataFrame(rows, columns=[desc.name for desc in cursor.description])
+    
+    def _connection_uri(self) -> str:
+        return (
+            f"postgresql://{quote(self.settings.user, safe='')}:{quote(self.settings.password, safe='')}"
+            f"@{self.settings.host}:{self.settings.port}/{quote(self.settings.database, safe='')}"
+            # ConnectorX opens its own connections, so make them read-only at startup
+            f"?options={quote('-c default_transaction_read_only=on', safe='')}"
+        )
+    
+    def _read_connectorx(self, query: str) -> pd.DataFrame:
+        # ConnectorX pulls rows via binary COPY straight into columnar buffers,
+        # optionally splitting the scan over several connections
+        options = {}
+        if self.settings.partition_on:
+            options['partition_on'] = self.settings.partition_on
+            options['partition_num'] = os.cpu_count() or 4
+        return cx.read_sql(self._connection_uri(), query, return_type='pandas', **options)
+    
     def execute_query(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
         try:
             if params:
                 query = query.format(**params)
-            result = self.connection.raw_sql(query).fetchall()
-            columns = [desc[0] for desc in self.connection.raw_sql(query).description]
-            return pd.DataFrame(result, columns=columns)
+            if self.settings.use_connectorx:
+                return self._read_connectorx(query)
+            with self.pool.connection() as connection, connection.cursor() as cursor:
+                cursor.execute(query)
+                return self._to_frame(cursor)
+        except Exception as e:
+            raise DatabaseError(f"Failed to execute PostgreSQL query: {str(e)}")
+    
+    def execute_query_iter(
+        self,
+        query: str,
+        params: Optional[Dict] = None,
+        batch_size: int = 25000
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            if params:
+                query = query.format(**params)
+            # A named cursor keeps the result set on the server between fetches and
+            # holds its connection until the last batch, so streams get their own
+            # connection: validating source against target would otherwise need two
+            # pool slots and deadlock with DB_POOL_SIZE=1
+            with Connection.connect(self.conninfo) as connection, \
+                    connection.cursor(name='data_validation_stream') as cursor:
+                self._configure(connection)
+                cursor.itersize = batch_size
+                cursor.execute(query)
+                columns = [desc.name for desc in cursor.description]
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield pd.DataFrame(rows, columns=columns)
         except Exception as e:
             raise DatabaseError(f"Failed to execute PostgreSQL query: {str(e)}")
     
     def close(self):
-        if self.connection:
-            self.connection.close()
+        if self.pool:
+            self.pool.close()
+            self.pool = None
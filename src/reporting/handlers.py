@@ -1,9 +1,29 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
-import csv
+import datetime
+import decimal
 import json
+import numpy as np
+import orjson
 import pandas as pd
 
+def _json_default(value: Any) -> Any:
+    """Serialize the pandas/NumPy objects that appear in validation details."""
+    if isinstance(value, pd.DataFrame):
+        # Column-oriented, matching the DataFrame's own layout
+        return value.to_dict(orient='list')
+    if isinstance(value, np.generic):
+        return value.item()
+    if value is pd.NaT:
+        return None
+    if isinstance(value, decimal.Decimal):
+        # As a string so NUMERIC values keep their exact digits
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Also covers pd.Timestamp, which orjson and json reject as a datetime subclass
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
 class ValidationResult:
     def __init__(self, metric: str, status: str, details: Dict[str, Any]):
         self.metric = metric
@@ -20,15 +40,22 @@ class CSVResultHandler(ResultHandler):
         self.filename = filename
     
     def handle_result(self, results: List[ValidationResult]) -> None:
-        with open(self.filename, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=['metric', 'status', 'details'])
-            writer.writeheader()
-            for result in results:
-                writer.writerow({
-                    'metric': result.metric,
-                    'status': result.status,
-                    'details': json.dumps(result.details)
-                })
+        rows = [
+            {
+                'metric': result.metric,
+                'status': result.status,
+                'details': orjson.dumps(
+                    result.details,
+                    default=_json_default,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            }
+            for result in results
+        ]
+        # csv.DictWriter's \r\n row terminator, as before
+        pd.DataFrame(rows, columns=['metric', 'status', 'details']).to_csv(
+            self.filename, index=False, lineterminator='\r\n'
+        )
 
 class JSONResultHandler(ResultHandler):
     def __init__(self, filename: str):
@@ -36,4 +63,4 @@ class JSONResultHandler(ResultHandler):
     
     def handle_result(self, results: List[ValidationResult]) -> None:
         with open(self.filename, 'w') as f:
-            json.dump([vars(r) for r in results], f, indent=2)
\ No newline at end of file
+            json.dump([vars(r) for r in results], f, indent=2, default=_json_default)
\ No newline at end of file
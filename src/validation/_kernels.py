@@ -0,0 +1,64 @@
+"""Compiled comparison kernels shared by the validation strategies."""
+from typing import Tuple
+import numpy as np
+
+try:
+    import numba as nb
+except ImportError:  # numba is optional; fall back to numexpr/NumPy
+    nb = None
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; fall back to plain NumPy
+    ne = None
+
+# Below this many elements numexpr's thread start-up costs more than it saves
+NUMEXPR_MIN_SIZE = 100_000
+
+if nb is not None:
+    @nb.njit(parallel=True, cache=True)
+    def numeric_diff_mask(a, b, tol):
+        """Flag elements where |a - b| > tol in one pass, returning (mask, count)."""
+        n = a.shape[0]
+        mask = np.empty(n, np.bool_)
+        count = 0
+        # Split rows across threads, so even a single column runs in parallel
+        for i in nb.prange(n):
+            d = a[i] - b[i]
+            m = (d if d >= 0 else -d) > tol
+            mask[i] = m
+            count += m
+        return mask, count
+
+    # Pay the JIT cost once at import rather than on the first validation
+    numeric_diff_mask(np.zeros(4), np.zeros(4), 0.0)
+else:
+    numeric_diff_mask = None
+
+def exceeds_tolerance(a: np.ndarray, b: np.ndarray, tol: float) -> Tuple[np.ndarray, int]:
+    """Return a boolean mask of where |a - b| > tol and the number of hits.
+
+    float64 vectors go through the Numba kernel when numba is installed;
+    numexpr (for large inputs) and plain NumPy are the fallbacks without it.
+    """
+    if a.dtype == np.int64:
+        return _int64_exceeds_tolerance(a, b, tol)
+    if numeric_diff_mask is not None and a.ndim == 1 and a.dtype == b.dtype == np.float64:
+        mask, count = numeric_diff_mask(a, b, float(tol))
+        return mask, int(count)
+    if ne is not None and a.size >= NUMEXPR_MIN_SIZE:
+        mask = ne.evaluate("abs(a - b) > tol", local_dict={'a': a, 'b': b, 'tol': tol})
+    else:
+        mask = np.abs(a - b) > tol
+    return mask, int(np.count_nonzero(mask))
+
+def _int64_exceeds_tolerance(a: np.ndarray, b: np.ndarray, tol: float) -> Tuple[np.ndarray, int]:
+    # a - b can overflow int64, so never subtract in signed arithmetic
+    if 0 <= tol < 1:
+        mask = a != b
+    else:
+        # uint64 holds the distance between any two int64 values exactly
+        diff = a.view(np.uint64) - b.view(np.uint64)
+        np.negative(diff, out=diff, where=a < b)
+        mask = diff > tol
+    return mask, int(np.count_nonzero(mask))
@@ -1,87 +1,231 @@
 from abc import ABC, abstractmethod
+import re
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Dict, Any, List
+
+from ._kernels import exceeds_tolerance
+
+# Layout of the per-cell differences reported by value-comparing strategies
+DIFFERENCE_COLUMNS = ['row', 'column', 'expected', 'actual']
+
+def merge_differences(left: Any, right: Any) -> Any:
+    """Combine the differences reported for two consecutive batches."""
+    if isinstance(left, pd.DataFrame):
+        return pd.concat([left, right], ignore_index=True)
+    if isinstance(left, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = merge_differences(left[key], value) if key in left else value
+        return merged
+    # Lists of rows/values concatenate, counts add up
+    return left + right
+
+def _is_number(dtype) -> bool:
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+def _is_int64(dtype) -> bool:
+    # NumPy integers that fit int64 without loss; nullable and uint64 columns go through float64
+    return isinstance(dtype, np.dtype) and (
+        dtype.kind == 'i' or (dtype.kind == 'u' and dtype.itemsize < 8)
+    )
+
+def _difference_frame(
+    index: pd.Index,
+    columns: List[str],
+    rows: List[np.ndarray],
+    cols: List[np.ndarray],
+    expected: List[np.ndarray],
+    actual: List[np.ndarray]
+) -> pd.DataFrame:
+    """Assemble per-column mismatches (row positions, column positions, values)."""
+    if not rows:
+        return pd.DataFrame(columns=DIFFERENCE_COLUMNS)
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    # Report in row-major order
+    order = np.lexsort((cols, rows))
+    return pd.DataFrame({
+        'row': index[rows[order]],
+        'column': pd.Index(columns)[cols[order]],
+        'expected': np.concatenate(expected)[order],
+        'actual': np.concatenate(actual)[order]
+    }, columns=DIFFERENCE_COLUMNS)
+
+def _is_text(dtype) -> bool:
+    return pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype)
+
+def _holds_text(values: pd.Series) -> bool:
+    # Nulls aside, every value is a string (an all-null column counts too)
+    return pd.api.types.infer_dtype(values, skipna=True) in ('string', 'empty')
 
 class ValidationStrategy(ABC):
+    # Whether batches can be validated independently and their differences merged
+    row_wise = True
+    # (schema, columns) pair, swapped as one object so concurrent readers never mix them
+    _binding = None
+    
     @abstractmethod
     def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+        """Compare two frames that share the same index and columns."""
+        pass
+    
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        """Return the columns of ``schema`` (a dtypes Series) this strategy checks."""
+        return schema.index.tolist()
+    
+    def bind(self, schema: pd.Series) -> None:
+        """Resolve the applicable columns once for a fixed schema."""
+        self._binding = (schema, self.applicable_columns(schema))
+    
+    def columns_for(self, data: pd.DataFrame) -> List[str]:
+        """Return the applicable columns of ``data``, rebinding if its schema changed."""
+        schema = data.dtypes
+        binding = self._binding
+        if binding is None or not binding[0].equals(schema):
+            self.bind(schema)
+            binding = self._binding
+        return binding[1]
+    
+    def validate_bound(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+        """Validate frames whose schema is the one passed to the last ``bind``.
+        
+        Strategies that check a subset of columns reuse the bound columns
+        without re-checking the schema; the default just calls ``validate``.
+        """
+        return self.validate(expected_data, actual_data)
+
+class ColumnValidation(ValidationStrategy):
+    """Base for strategies that compare the columns picked by ``applicable_columns``."""
+    
+    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+        return self.compare(expected_data, actual_data, self.columns_for(expected_data))
+    
+    def validate_bound(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+        return self.compare(expected_data, actual_data, self._binding[1])
+    
+    @abstractmethod
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+        """Compare ``columns`` of two frames that share the same index and columns."""
         pass
 
-class NumericValidation(ValidationStrategy):
+class NumericValidation(ColumnValidation):
     def __init__(self, tolerance: float):
         self.tolerance = tolerance
     
-    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
-        differences = {}
-        
-        for column in expected_data.columns:
-            if pd.api.types.is_numeric_dtype(expected_data[column]):
-                diff = (expected_data[column] - actual_data[column]).abs()
-                mask = diff > self.tolerance
-                if mask.any():
-                    differences[column] = {
-                        'expected': expected_data.loc[mask, column].to_dict(),
-                        'actual': actual_data.loc[mask, column].to_dict()
-                    }
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        return [column for column, dtype in schema.items() if _is_number(dtype)]
+    
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+        rows, cols, expected, actual = [], [], [], []
+        for position, column in enumerate(columns):
+            exp_col = expected_data[column]
+            act_col = actual_data[column]
+            # Integer columns stay in int64 so values above 2**53 compare exactly;
+            # NumPy columns are read in place rather than copied into a 2D block
+            if _is_int64(exp_col.dtype) and _is_int64(act_col.dtype):
+                exp_values = exp_col.to_numpy(dtype='int64')
+                act_values = act_col.to_numpy(dtype='int64')
+                report_dtype = object  # Python ints stay exact next to float differences
+            else:
+                exp_values = exp_col.to_numpy(dtype='float64', na_value=np.nan)
+                act_values = act_col.to_numpy(dtype='float64', na_value=np.nan)
+                report_dtype = 'float64'
+            mask, count = exceeds_tolerance(exp_values, act_values, self.tolerance)
+            if not count:
+                continue
+            
+            idx = np.flatnonzero(mask)
+            rows.append(idx)
+            cols.append(np.full(len(idx), position))
+            expected.append(exp_values[idx].astype(report_dtype))
+            actual.append(act_values[idx].astype(report_dtype))
         
         return {
-            'status': 'fail' if differences else 'pass',
-            'differences': differences
+            'status': 'fail' if rows else 'pass',
+            'differences': _difference_frame(expected_data.index, columns, rows, cols, expected, actual)
         }
 
-class CategoricalValidation(ValidationStrategy):
-    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
-        differences = {}
-        
-        for column in expected_data.columns:
-            if pd.api.types.is_object_dtype(expected_data[column]):
-                mask = expected_data[column] != actual_data[column]
-                if mask.any():
-                    differences[column] = {
-                        'expected': expected_data.loc[mask, column].to_dict(),
-                        'actual': actual_data.loc[mask, column].to_dict()
-                    }
+class CategoricalValidation(ColumnValidation):
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        return [column for column, dtype in schema.items() if _is_text(dtype)]
+    
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+        rows, cols, expected, actual = [], [], [], []
+        for position, column in enumerate(columns):
+            exp_col = expected_data[column]
+            act_col = actual_data[column]
+            mask = exp_col.ne(act_col).to_numpy(dtype=bool, na_value=True)
+            if not mask.any():
+                continue
+            # Cells that are null on both sides match, whatever the null marker
+            mask &= ~(exp_col.isna().to_numpy() & act_col.isna().to_numpy())
+            idx = np.flatnonzero(mask)
+            if not len(idx):
+                continue
+            
+            # Only the mismatched cells are converted for the report
+            rows.append(idx)
+            cols.append(np.full(len(idx), position))
+            expected.append(exp_col.iloc[idx].to_numpy(dtype=object, na_value=None))
+            actual.append(act_col.iloc[idx].to_numpy(dtype=object, na_value=None))
         
         return {
-            'status': 'fail' if differences else 'pass',
-            'differences': differences
+            'status': 'fail' if rows else 'pass',
+            'differences': _difference_frame(expected_data.index, columns, rows, cols, expected, actual)
         }
 
 # src/validation/strategies.py
 # ... (previous ValidationStrategy, NumericValidation, and CategoricalValidation classes remain the same)
 
-class DateTimeValidation(ValidationStrategy):
+class DateTimeValidation(ColumnValidation):
     """Validates datetime fields with optional timezone handling."""
     def __init__(self, timezone_aware: bool = True, allow_time_difference_seconds: int = 0):
         self.timezone_aware = timezone_aware
         self.allowed_difference = pd.Timedelta(seconds=allow_time_difference_seconds)
     
-    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
-        differences = {}
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        return [
+            column for column, dtype in schema.items()
+            if pd.api.types.is_datetime64_any_dtype(dtype)
+        ]
+    
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
+        frames = []
+        allowed_ns = self.allowed_difference.value
         
-        for column in expected_data.columns:
-            if pd.api.types.is_datetime64_any_dtype(expected_data[column]):
-                # Convert to timezone-naive if needed
-                if not self.timezone_aware:
-                    expected_col = pd.DatetimeIndex(expected_data[column]).tz_localize(None)
-                    actual_col = pd.DatetimeIndex(actual_data[column]).tz_localize(None)
-                else:
-                    expected_col = expected_data[column]
-                    actual_col = actual_data[column]
-                
-                # Compare with allowed time difference
-                time_diff = abs(expected_col - actual_col)
-                mask = time_diff > self.allowed_difference
-                
-                if mask.any():
-                    differences[column] = {
-                        'expected': expected_data.loc[mask, column].dt.strftime('%Y-%m-%d %H:%M:%S%z').to_dict(),
-                        'actual': actual_data.loc[mask, column].dt.strftime('%Y-%m-%d %H:%M:%S%z').to_dict(),
-                        'difference_seconds': time_diff[mask].total_seconds().to_dict()
-                    }
+        for column in columns:
+            expected_col = pd.DatetimeIndex(expected_data[column]).as_unit('ns')
+            actual_col = pd.DatetimeIndex(actual_data[column]).as_unit('ns')
+            # Convert to timezone-naive if needed
+            if not self.timezone_aware:
+                expected_col = expected_col.tz_localize(None)
+                actual_col = actual_col.tz_localize(None)
+            
+            # Compare as int64 nanoseconds; NaT never counts as a difference
+            exp_ns = expected_col.asi8
+            act_ns = actual_col.asi8
+            mask, _ = exceeds_tolerance(exp_ns, act_ns, allowed_ns)
+            mask &= ~(expected_col.isna() | actual_col.isna())
+            
+            if mask.any():
+                # Only the (usually few) mismatched values get formatted
+                idx = np.flatnonzero(mask)
+                frames.append(pd.DataFrame({
+                    'row': expected_data.index[idx],
+                    'column': column,
+                    'expected': expected_data[column].iloc[idx].dt.strftime('%Y-%m-%d %H:%M:%S%z').to_numpy(),
+                    'actual': actual_data[column].iloc[idx].dt.strftime('%Y-%m-%d %H:%M:%S%z').to_numpy(),
+                    'difference_seconds': np.abs(exp_ns[idx] - act_ns[idx]) / 1e9
+                }))
         
+        differences = (
+            pd.concat(frames, ignore_index=True) if frames
+            else pd.DataFrame(columns=DIFFERENCE_COLUMNS + ['difference_seconds'])
+        )
         return {
-            'status': 'fail' if differences else 'pass',
+            'status': 'fail' if frames else 'pass',
             'differences': differences
         }
 
@@ -93,97 +237,122 @@ class NullValidation(ValidationStrategy):
     def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
         differences = {}
         
-        for column in expected_data.columns:
-            expected_nulls = expected_data[column].isna()
-            if self.treat_empty_as_null:
-                expected_nulls |= (expected_data[column] == '') | (expected_data[column] == 'null/empty')
-            
-            actual_nulls = actual_data[column].isna()
-            if self.treat_empty_as_null:
-                actual_nulls |= (actual_data[column] == '') | (actual_data[column] == 'null/empty')
-            
-            mask = expected_nulls != actual_nulls
-            if mask.any():
-                differences[column] = {
-                    'mismatched_rows': mask.sum(),
-                    'expected_null_count': expected_nulls.sum(),
-                    'actual_null_count': actual_nulls.sum(),
-                    'rows_with_differences': mask[mask].index.tolist()
-                }
+        expected_nulls = self._null_mask(expected_data)
+        actual_nulls = self._null_mask(actual_data)
+        
+        mismatch = expected_nulls != actual_nulls
+        mismatch_counts = mismatch.sum(axis=0)
+        
+        for pos in np.flatnonzero(mismatch_counts):
+            differences[expected_data.columns[pos]] = {
+                'mismatched_rows': int(mismatch_counts[pos]),
+                'rows_with_differences': expected_data.index[mismatch[:, pos]].tolist()
+            }
         
         return {
             'status': 'fail' if differences else 'pass',
             'differences': differences
         }
+    
+    def _null_mask(self, data: pd.DataFrame) -> np.ndarray:
+        """Return a 2D boolean array flagging null cells of ``data``."""
+        nulls = data.isna().to_numpy()
+        if self.treat_empty_as_null:
+            # Only text columns can hold the empty-string markers
+            text_positions = data.columns.get_indexer(
+                data.select_dtypes(include=['object', 'string']).columns
+            )
+            if len(text_positions):
+                if not nulls.flags.writeable:
+                    # Copy-on-write pandas hands out read-only views
+                    nulls = nulls.copy()
+                text = data.iloc[:, text_positions].to_numpy(dtype=object, na_value=None)
+                nulls[:, text_positions] |= (text == '') | (text == 'null/empty')
+        return nulls
 
-class DistributionValidation(ValidationStrategy):
+class DistributionValidation(ColumnValidation):
     """Validates statistical distribution of numeric columns."""
+    # Statistics must be computed over the full data, not per batch
+    row_wise = False
+    STATISTICS = ['mean', 'median', 'std', 'min', 'max']
+    
     def __init__(self, threshold_pct: float = 5.0):
         self.threshold_pct = threshold_pct
     
-    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        return [column for column, dtype in schema.items() if _is_number(dtype)]
+    
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
         differences = {}
         
-        for column in expected_data.columns:
-            if pd.api.types.is_numeric_dtype(expected_data[column]):
-                expected_stats = {
-                    'mean': expected_data[column].mean(),
-                    'median': expected_data[column].median(),
-                    'std': expected_data[column].std(),
-                    'min': expected_data[column].min(),
-                    'max': expected_data[column].max()
-                }
-                
-                actual_stats = {
-                    'mean': actual_data[column].mean(),
-                    'median': actual_data[column].median(),
-                    'std': actual_data[column].std(),
-                    'min': actual_data[column].min(),
-                    'max': actual_data[column].max()
+        num_exp = expected_data[columns]
+        if len(num_exp.columns):
+            # One aggregation per side instead of a pass per statistic and column
+            expected_stats = num_exp.agg(self.STATISTICS)
+            actual_stats = actual_data[num_exp.columns].agg(self.STATISTICS)
+            
+            # Calculate percentage differences, skipping statistics whose expected value is 0
+            pct_diff = (expected_stats - actual_stats).abs() / expected_stats.replace(0, np.nan) * 100
+            flagged = pct_diff > self.threshold_pct
+            
+            for column in flagged.columns[flagged.any()]:
+                differences[column] = {
+                    stat: {
+                        'expected': expected_stats.at[stat, column],
+                        'actual': actual_stats.at[stat, column],
+                        'difference_pct': pct_diff.at[stat, column]
+                    }
+                    for stat in flagged.index[flagged[column]]
                 }
-                
-                # Calculate percentage differences
-                stat_differences = {}
-                for stat, expected_value in expected_stats.items():
-                    actual_value = actual_stats[stat]
-                    if expected_value != 0:
-                        pct_diff = abs(expected_value - actual_value) / expected_value * 100
-                        if pct_diff > self.threshold_pct:
-                            stat_differences[stat] = {
-                                'expected': expected_value,
-                                'actual': actual_value,
-                                'difference_pct': pct_diff
-                            }
-                
-                if stat_differences:
-                    differences[column] = stat_differences
         
         return {
             'status': 'fail' if differences else 'pass',
             'differences': differences
         }
 
-class PatternValidation(ValidationStrategy):
+class PatternValidation(ColumnValidation):
     """Validates text patterns using regular expressions."""
     def __init__(self, patterns: Dict[str, str]):
         self.patterns = {k: re.compile(v) for k, v in patterns.items()}
+        # Anchored like re.match so Arrow's RE2 engine agrees with str.match
+        self.arrow_patterns = {k: f'^(?:{v})' for k, v in patterns.items()}
     
-    def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+    def applicable_columns(self, schema: pd.Series) -> List[str]:
+        # Only text columns that actually have a pattern configured
+        return [
+            column for column in self.patterns
+            if column in schema.index and _is_text(schema[column])
+        ]
+    
+    def _matches(self, column: str, values: pd.Series) -> np.ndarray:
+        try:
+            matches = pc.match_substring_regex(
+                pa.array(values, from_pandas=True), self.arrow_patterns[column]
+            ).fill_null(False)
+            return matches.to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Regex features RE2 lacks (e.g. backreferences)
+            return values.str.match(self.patterns[column], na=False).to_numpy(dtype=bool)
+    
+    def compare(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame, columns: List[str]) -> Dict[str, Any]:
         differences = {}
         
-        for column in expected_data.columns:
-            if pd.api.types.is_string_dtype(expected_data[column]):
-                column_pattern = self.patterns.get(column)
-                if column_pattern:
-                    expected_matches = expected_data[column].str.match(column_pattern).fillna(False)
-                    actual_matches = actual_data[column].str.match(column_pattern).fillna(False)
-                    
-                    mask = expected_matches != actual_matches
-                    if mask.any():
-                        differences[column] = {
-                            'mismatched_rows': mask.sum(),
-                            'invalid_values': actual_data.loc[~actual_matches, column].to_dict()
-                        }
+        for column in columns:
+            # Object columns can hold non-text values (e.g. NUMERIC as Decimal), so check the values
+            if not (_holds_text(expected_data[column]) and _holds_text(actual_data[column])):
+                continue
+            expected_matches = self._matches(column, expected_data[column])
+            actual_matches = self._matches(column, actual_data[column])
+            
+            mismatched_rows = int(np.count_nonzero(expected_matches != actual_matches))
+            if mismatched_rows:
+                # Slice the invalid values straight from NumPy instead of Series.to_dict()
+                invalid = np.flatnonzero(~actual_matches)
+                values = actual_data[column].to_numpy(dtype=object, na_value=None)[invalid]
+                differences[column] = {
+                    'mismatched_rows': mismatched_rows,
+                    'invalid_values': dict(zip(actual_data.index[invalid].tolist(), values.tolist()))
+                }
         
         return {
             'status': 'fail' if differences else 'pass',
@@ -195,12 +364,26 @@ class CompositeValidation(ValidationStrategy):
     def __init__(self, strategies: List[ValidationStrategy]):
         self.strategies = strategies
     
+    @property
+    def row_wise(self) -> bool:
+        return all(strategy.row_wise for strategy in self.strategies)
+    
+    def bind(self, schema: pd.Series) -> None:
+        super().bind(schema)
+        for strategy in self.strategies:
+            strategy.bind(schema)
+    
     def validate(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
+        # Check the schema once, rebinding every strategy if it changed
+        self.columns_for(expected_data)
+        return self.validate_bound(expected_data, actual_data)
+    
+    def validate_bound(self, expected_data: pd.DataFrame, actual_data: pd.DataFrame) -> Dict[str, Any]:
         all_differences = {}
         overall_status = 'pass'
         
         for strategy in self.strategies:
-            result = strategy.validate(expected_data, actual_data)
+            result = strategy.validate_bound(expected_data, actual_data)
             if result['status'] == 'fail':
                 overall_status = 'fail'
                 strategy_name = strategy.__class__.__name__
@@ -1,9 +1,25 @@
-from typing import Dict, Any, List
+from itertools import zip_longest
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 import pandas as pd
+from ..core.exceptions import ValidationError
 from ..database.base import DatabaseConnector
-from .strategies import ValidationStrategy
+from ..database.duckdb import DuckDBConnector
+from .strategies import ValidationStrategy, merge_differences
+
+# DuckDB types compared with a tolerance in pushdown validation, besides DECIMAL(p, s)
+NUMERIC_TYPES = {
+    'TINYINT', 'SMALLINT', 'INTEGER', 'BIGINT', 'HUGEINT',
+    'UTINYINT', 'USMALLINT', 'UINTEGER', 'UBIGINT', 'UHUGEINT',
+    'FLOAT', 'DOUBLE'
+}
+
+def _quote(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
 
 class DataValidator:
+    # Temporary table holding the source rows during pushdown validation
+    PUSHDOWN_TABLE = '_dvf_expected'
+    
     def __init__(
         self,
         source_db: DatabaseConnector,
@@ -17,23 +33,228 @@ class DataValidator:
         self.batch_size = batch_size
     
     def validate_query(self, source_query: str, target_query: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Validate two queries batch by batch.
+        
+        Both sides are streamed in ``batch_size`` row chunks and paired up
+        positionally, so the queries should return rows in the same order
+        (e.g. ``ORDER BY`` the primary key). Strategies that need the full data
+        set (see ``ValidationStrategy.row_wise``) get the concatenated batches.
+        """
         try:
-            source_data = self.source_db.execute_query(source_query, params)
-            target_data = self.target_db.execute_query(target_query, params)
+            source_batches = self._rebatch(
+                self.source_db.execute_query_iter(source_query, params, self.batch_size)
+            )
+            target_batches = self._rebatch(
+                self.target_db.execute_query_iter(target_query, params, self.batch_size)
+            )
+            
+            if not self.validation_strategy.row_wise:
+                source_batches = [self._concat(source_batches)]
+                target_batches = [self._concat(target_batches)]
             
-            # Align columns
-            common_columns = source_data.columns.intersection(target_data.columns)
-            source_data = source_data[common_columns]
-            target_data = target_data[common_columns]
+            validate_batch = None
+            differences = None
+            status = 'pass'
+            source_rows = target_rows = 0
+            
+            for source_data, target_data in zip_longest(source_batches, target_batches):
+                source_rows += 0 if source_data is None else len(source_data)
+                target_rows += 0 if target_data is None else len(target_data)
+                if source_data is None or target_data is None:
+                    continue
+                
+                # Every batch of a query has the same schema, so specialize once
+                if validate_batch is None:
+                    validate_batch = self._compile(source_data, target_data)
+                
+                # Validate data
+                result = validate_batch(source_data, target_data)
+                if result['status'] == 'fail':
+                    status = 'fail'
+                    differences = (
+                        result['differences'] if differences is None
+                        else merge_differences(differences, result['differences'])
+                    )
+            
+            return {
+                'status': status,
+                'details': differences if status == 'fail' else {},
+                'source_rows': source_rows,
+                'target_rows': target_rows
+            }
+        except Exception as e:
+            raise ValidationError(f"Validation failed: {str(e)}")
+    
+    def _compile(
+        self,
+        source_data: pd.DataFrame,
+        target_data: pd.DataFrame
+    ) -> Callable[[pd.DataFrame, pd.DataFrame], Dict[str, Any]]:
+        """Build a batch validator specialized for the schema of the first batch.
+        
+        The common columns are resolved and the strategy is bound to their
+        dtypes up front. Later batches are only re-selected when a side has
+        other columns, and the strategy reuses its bound columns after a
+        single dtypes comparison per batch; it is rebound only when a batch's
+        dtypes drift (e.g. an all-null batch read as objects).
+        """
+        common_columns = source_data.columns.intersection(target_data.columns)
+        schema = source_data.dtypes[common_columns]
+        strategy = self.validation_strategy
+        strategy.bind(schema)
+        # Batches of one stream share their columns, so decide on the selection once
+        select_source = not source_data.columns.equals(common_columns)
+        select_target = not target_data.columns.equals(common_columns)
+        common_columns = common_columns.tolist()
+        
+        def validate_batch(source: pd.DataFrame, target: pd.DataFrame) -> Dict[str, Any]:
+            nonlocal schema
+            if select_source:
+                source = source[common_columns]
+            if select_target:
+                target = target[common_columns]
+            # Align rows once so strategies can compare positionally; full batches
+            # already share the same RangeIndex
+            if not source.index.equals(target.index):
+                source, target = source.align(target, join='inner', axis=0)
+            if not source.dtypes.equals(schema):
+                schema = source.dtypes
+                strategy.bind(schema)
+            return strategy.validate_bound(source, target)
+        
+        return validate_batch
+    
+    def _rebatch(self, batches: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Re-chunk a stream of frames into exactly ``batch_size`` rows.
+        
+        Each chunk carries a RangeIndex continuing from the previous one so
+        reported row labels refer to positions in the full result.
+        """
+        offset = 0
+        buffer = None
+        for batch in batches:
+            buffer = batch if buffer is None else pd.concat([buffer, batch], ignore_index=True)
+            while len(buffer) >= self.batch_size:
+                chunk, buffer = buffer.iloc[:self.batch_size], buffer.iloc[self.batch_size:]
+                yield chunk.set_axis(pd.RangeIndex(offset, offset + len(chunk)))
+                offset += len(chunk)
+        if buffer is not None and len(buffer):
+            yield buffer.set_axis(pd.RangeIndex(offset, offset + len(buffer)))
+    
+    @staticmethod
+    def _concat(batches: Iterable[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        batches = list(batches)
+        return pd.concat(batches) if batches else None
+    
+    def validate_query_pushdown(
+        self,
+        source_query: str,
+        target_query: str,
+        params: Dict[str, Any] = None,
+        key_columns: Optional[List[str]] = None,
+        tolerance: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Validate by uploading the source rows into DuckDB and diffing there.
+        
+        Without ``tolerance`` rows are compared exactly with ``EXCEPT ALL`` in
+        both directions. With ``tolerance`` and ``key_columns`` the sides are
+        joined on the keys and numeric columns are compared with
+        ``abs(expected - actual) > tolerance``; keys present on only one side
+        are reported as missing or unexpected. Either way only mismatching
+        rows are transferred back to the client.
+        """
+        if not isinstance(self.target_db, DuckDBConnector):
+            raise ValidationError("Pushdown validation requires a DuckDB target database")
+        if tolerance is not None and not key_columns:
+            raise ValidationError("Pushdown validation with a tolerance requires key_columns")
+        
+        try:
+            source_data = self.source_db.execute_query(source_query, params)
+            if params:
+                target_query = target_query.format(**params)
+            target = f"({target_query}) AS t"
             
-            # Validate data
-            result = self.validation_strategy.validate(source_data, target_data)
+            # The uploaded table is connection-scoped, so hold one connection throughout
+            with self.target_db.acquire():
+                target_columns = self.target_db.execute_query(f"SELECT * FROM {target} LIMIT 0").columns
+                common_columns = source_data.columns.intersection(target_columns)
+                self.target_db.register_dataframe(self.PUSHDOWN_TABLE, source_data[common_columns])
+                try:
+                    target_rows = self.target_db.execute_query(f"SELECT count(*) AS n FROM {target}")['n'].iloc[0]
+                    
+                    if tolerance is None:
+                        details = self._pushdown_exact(target, common_columns)
+                    else:
+                        details = self._pushdown_numeric(target, key_columns, tolerance)
+                finally:
+                    self.target_db.unregister_dataframe(self.PUSHDOWN_TABLE)
             
             return {
-                'status': result['status'],
-                'details': result['differences'] if result['status'] == 'fail' else {},
+                'status': 'fail' if len(details) else 'pass',
+                'details': details,
                 'source_rows': len(source_data),
-                'target_rows': len(target_data)
+                'target_rows': int(target_rows)
             }
+        except ValidationError:
+            raise
         except Exception as e:
-            raise ValidationError(f"Validation failed: {str(e)}")
\ No newline at end of file
+            raise ValidationError(f"Validation failed: {str(e)}")
+    
+    def _pushdown_exact(self, target: str, columns: pd.Index) -> Dict[str, Any]:
+        select_list = ', '.join(_quote(c) for c in columns)
+        expected = f"SELECT {select_list} FROM {self.PUSHDOWN_TABLE}"
+        actual = f"SELECT {select_list} FROM {target}"
+        
+        details = {}
+        missing = self.target_db.execute_query(f"{expected} EXCEPT ALL {actual}")
+        if not missing.empty:
+            details['missing_in_target'] = missing
+        unexpected = self.target_db.execute_query(f"{actual} EXCEPT ALL {expected}")
+        if not unexpected.empty:
+            details['unexpected_in_target'] = unexpected
+        return details
+    
+    def _pushdown_numeric(self, target: str, key_columns: List[str], tolerance: float) -> Dict[str, Any]:
+        keys = ', '.join(_quote(c) for c in key_columns)
+        
+        # Rows whose key exists on one side only never reach the value comparison
+        details = {}
+        missing = self.target_db.execute_query(
+            f"SELECT {keys} FROM {self.PUSHDOWN_TABLE} ANTI JOIN {target} USING ({keys})"
+        )
+        if not missing.empty:
+            details['missing_in_target'] = missing
+        unexpected = self.target_db.execute_query(
+            f"SELECT {keys} FROM {target} ANTI JOIN {self.PUSHDOWN_TABLE} USING ({keys})"
+        )
+        if not unexpected.empty:
+            details['unexpected_in_target'] = unexpected
+        
+        # Take the value columns from DuckDB's types: DECIMAL columns (and NUMERIC
+        # read through psycopg as Decimal objects) aren't numeric dtypes in pandas
+        types = self.target_db.execute_query(
+            "SELECT column_name, data_type FROM duckdb_columns() "
+            f"WHERE database_name = 'temp' AND table_name = '{self.PUSHDOWN_TABLE}' "
+            "ORDER BY column_index"
+        )
+        value_columns = [
+            c for c, data_type in zip(types['column_name'], types['data_type'])
+            if c not in key_columns and (data_type in NUMERIC_TYPES or data_type.startswith('DECIMAL'))
+        ]
+        if not value_columns:
+            return details
+        
+        checks = ' UNION ALL '.join(
+            f"SELECT {keys}, {i} AS column_pos, "
+            f"CAST(e.{_quote(c)} AS DOUBLE) AS expected, CAST(t.{_quote(c)} AS DOUBLE) AS actual "
+            f"FROM {self.PUSHDOWN_TABLE} AS e JOIN {target} USING ({keys}) "
+            f"WHERE abs(e.{_quote(c)} - t.{_quote(c)}) > {float(tolerance)!r}"
+            for i, c in enumerate(value_columns)
+        )
+        mismatches = self.target_db.execute_query(checks)
+        if not mismatches.empty:
+            # Same long layout as NumericValidation, keyed by the join columns
+            column = pd.Index(value_columns)[mismatches.pop('column_pos').to_numpy()]
+            mismatches.insert(len(key_columns), 'column', column)
+            details['differences'] = mismatches
+        return details
@@ -0,0 +1,64 @@
+import csv
+import json
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+
+from src.reporting.handlers import CSVResultHandler, JSONResultHandler, ValidationResult
+
+def _results():
+    differences = pd.DataFrame({
+        'row': [3],
+        'column': ['at'],
+        'expected': [pd.Timestamp('2024-01-01 12:00')],
+        'actual': [pd.NaT]
+    })
+    return [
+        ValidationResult('orders', 'fail', {'differences': differences, 'rows': np.int64(10)}),
+        ValidationResult('customers', 'pass', {})
+    ]
+
+def test_csv_handler_writes_details_as_json(tmp_path):
+    path = tmp_path / 'results.csv'
+    
+    CSVResultHandler(str(path)).handle_result(_results())
+    
+    assert path.read_bytes().count(b'\r\n') == 3
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['metric'], row['status']) for row in rows] == [('orders', 'fail'), ('customers', 'pass')]
+    assert json.loads(rows[0]['details']) == {
+        'differences': {'row': [3], 'column': ['at'], 'expected': ['2024-01-01T12:00:00'], 'actual': [None]},
+        'rows': 10
+    }
+    assert json.loads(rows[1]['details']) == {}
+
+def test_json_handler_writes_results(tmp_path):
+    path = tmp_path / 'results.json'
+    
+    JSONResultHandler(str(path)).handle_result(_results())
+    
+    assert json.loads(path.read_text()) == [
+        {
+            'metric': 'orders',
+            'status': 'fail',
+            'details': {
+                'differences': {'row': [3], 'column': ['at'], 'expected': ['2024-01-01T12:00:00'], 'actual': [None]},
+                'rows': 10
+            }
+        },
+        {'metric': 'customers', 'status': 'pass', 'details': {}}
+    ]
+
+def test_handlers_write_decimals_as_strings(tmp_path):
+    details = {'amount': {'expected': Decimal('1.10'), 'actual': Decimal('1.20')}}
+    results = [ValidationResult('orders', 'fail', details)]
+    
+    CSVResultHandler(str(tmp_path / 'results.csv')).handle_result(results)
+    JSONResultHandler(str(tmp_path / 'results.json')).handle_result(results)
+    
+    with open(tmp_path / 'results.csv', newline='') as f:
+        row = next(csv.DictReader(f))
+    assert json.loads(row['details']) == {'amount': {'expected': '1.10', 'actual': '1.20'}}
+    assert json.loads((tmp_path / 'results.json').read_text())[0]['details'] == json.loads(row['details'])
@@ -0,0 +1,66 @@
+import os
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from src.config.settings import DatabaseSettings
+from src.core.exceptions import DatabaseError
+from src.database.postgres import PostgresConnector
+from src.validation.strategies import NumericValidation
+from src.validation.validator import DataValidator
+
+# Point these at a disposable server, e.g.
+#   docker run -d -e POSTGRES_PASSWORD=postgres -p 5432:5432 postgres
+POSTGRES_TEST_HOST = os.environ.get('POSTGRES_TEST_HOST')
+
+pytestmark = pytest.mark.skipif(
+    not POSTGRES_TEST_HOST, reason="set POSTGRES_TEST_HOST to run against PostgreSQL"
+)
+
+@pytest.fixture
+def postgres():
+    connector = PostgresConnector(DatabaseSettings(
+        host=POSTGRES_TEST_HOST,
+        port=int(os.environ.get('POSTGRES_TEST_PORT', 5432)),
+        database=os.environ.get('POSTGRES_TEST_DB', 'postgres'),
+        user=os.environ.get('POSTGRES_TEST_USER', 'postgres'),
+        password=os.environ.get('POSTGRES_TEST_PASSWORD', 'postgres'),
+        # A single pooled connection, so streaming both sides can't rely on pool slack
+        pool_size=1
+    ))
+    connector.connect()
+    yield connector
+    connector.close()
+
+def test_execute_query_returns_frame(postgres):
+    result = postgres.execute_query("SELECT 1 AS id, 1.50::numeric AS amount, 'a' AS name")
+    
+    assert result.columns.tolist() == ['id', 'amount', 'name']
+    assert result.iloc[0].tolist() == [1, Decimal('1.50'), 'a']
+
+def test_execute_query_iter_yields_batches(postgres):
+    batches = list(postgres.execute_query_iter(
+        "SELECT g AS id FROM generate_series(1, 10) AS g ORDER BY g", batch_size=4
+    ))
+    
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert pd.concat(batches)['id'].tolist() == list(range(1, 11))
+
+def test_connections_are_read_only(postgres):
+    with pytest.raises(DatabaseError, match="read-only"):
+        postgres.execute_query("CREATE TABLE dvf_read_only_check (id int)")
+
+def test_validate_query_streams_both_sides(postgres):
+    validator = DataValidator(postgres, postgres, NumericValidation(0), batch_size=30)
+    source = "SELECT g AS id, g * 1.5::float8 AS amount FROM generate_series(1, 100) AS g ORDER BY g"
+    target = (
+        "SELECT g AS id, CASE WHEN g = 42 THEN 0 ELSE g * 1.5::float8 END AS amount "
+        "FROM generate_series(1, 100) AS g ORDER BY g"
+    )
+    
+    result = validator.validate_query(source, target)
+    
+    assert result['status'] == 'fail'
+    assert (result['source_rows'], result['target_rows']) == (100, 100)
+    assert result['details'][['row', 'column']].values.tolist() == [[41, 'amount']]
@@ -0,0 +1,205 @@
+import numpy as np
+import pandas as pd
+
+from src.validation.strategies import (
+    CategoricalValidation,
+    CompositeValidation,
+    DateTimeValidation,
+    DistributionValidation,
+    NullValidation,
+    NumericValidation,
+    PatternValidation
+)
+
+def test_numeric_passes_within_tolerance():
+    expected = pd.DataFrame({'id': [1, 2], 'amount': [1.0, 2.0]})
+    actual = pd.DataFrame({'id': [1, 2], 'amount': [1.0005, 2.0]})
+    
+    result = NumericValidation(0.001).validate(expected, actual)
+    
+    assert result['status'] == 'pass'
+    assert result['differences'].empty
+
+def test_numeric_reports_cells_beyond_tolerance():
+    expected = pd.DataFrame({'id': [1, 2, 3], 'amount': [1.0, 2.0, np.nan]})
+    actual = pd.DataFrame({'id': [1, 5, 3], 'amount': [1.5, 2.0, np.nan]})
+    
+    result = NumericValidation(0.1).validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'].values.tolist() == [
+        [0, 'amount', 1.0, 1.5],
+        [1, 'id', 2, 5]
+    ]
+
+def test_numeric_without_numeric_columns_passes():
+    frame = pd.DataFrame({'name': ['a', 'b']})
+    
+    result = NumericValidation(0).validate(frame, frame.copy())
+    
+    assert result['status'] == 'pass'
+
+def test_numeric_compares_large_integers_exactly():
+    expected = pd.DataFrame({'id': [2**60]})
+    actual = pd.DataFrame({'id': [2**60 + 1]})
+    
+    result = NumericValidation(0).validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'][['expected', 'actual']].values.tolist() == [[2**60, 2**60 + 1]]
+
+def test_numeric_integer_differences_do_not_overflow():
+    int64 = np.iinfo(np.int64)
+    expected = pd.DataFrame({'id': [2**62, int64.min, int64.max, 7]})
+    actual = pd.DataFrame({'id': [-2**62, 0, int64.min, 7]})
+    
+    for tolerance in (0, 10):
+        result = NumericValidation(tolerance).validate(expected, actual)
+        assert result['differences']['row'].tolist() == [0, 1, 2]
+
+def test_categorical_passes_identical_frames_with_nulls():
+    frame = pd.DataFrame({
+        'code': ['a', None, 'c'],
+        'label': pd.array(['x', None, 'z'], dtype='string')
+    })
+    
+    result = CategoricalValidation().validate(frame, frame.copy())
+    
+    assert result['status'] == 'pass'
+    assert result['differences'].empty
+
+def test_categorical_reports_changed_cells():
+    expected = pd.DataFrame({'id': [1, 2], 'code': ['a', 'b']})
+    actual = pd.DataFrame({'id': [1, 2], 'code': ['a', None]})
+    
+    result = CategoricalValidation().validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'].values.tolist() == [[1, 'code', 'b', None]]
+
+def test_categorical_without_text_columns_passes():
+    frame = pd.DataFrame({'id': [1, 2], 'amount': [1.0, 2.0]})
+    
+    result = CategoricalValidation().validate(frame, frame.copy())
+    
+    assert result['status'] == 'pass'
+
+
+def test_datetime_passes_within_allowed_difference():
+    expected = pd.DataFrame({'at': pd.to_datetime(['2024-01-01 00:00:00', None])})
+    actual = pd.DataFrame({'at': pd.to_datetime(['2024-01-01 00:00:02', None])})
+    
+    result = DateTimeValidation(allow_time_difference_seconds=5).validate(expected, actual)
+    
+    assert result['status'] == 'pass'
+    assert result['differences'].empty
+
+def test_datetime_reports_cells_beyond_allowed_difference():
+    expected = pd.DataFrame({'at': pd.to_datetime(['2024-01-01 00:00:00', '2024-01-02 00:00:00'])})
+    actual = pd.DataFrame({'at': pd.to_datetime(['2024-01-01 00:00:10', '2024-01-02 00:00:00'])})
+    
+    result = DateTimeValidation(allow_time_difference_seconds=5).validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'].values.tolist() == [
+        [0, 'at', '2024-01-01 00:00:00', '2024-01-01 00:00:10', 10.0]
+    ]
+
+def test_datetime_without_datetime_columns_passes():
+    frame = pd.DataFrame({'id': [1, 2]})
+    
+    result = DateTimeValidation().validate(frame, frame.assign(id=[3, 4]))
+    
+    assert result['status'] == 'pass'
+
+def test_null_passes_matching_null_patterns():
+    expected = pd.DataFrame({'code': ['a', None, ''], 'amount': [1.0, np.nan, 3.0]})
+    actual = pd.DataFrame({'code': ['b', np.nan, None], 'amount': [2.0, np.nan, 4.0]})
+    
+    result = NullValidation().validate(expected, actual)
+    
+    assert result == {'status': 'pass', 'differences': {}}
+
+def test_null_reports_mismatched_rows():
+    expected = pd.DataFrame({'code': ['a', None, ''], 'amount': [1.0, np.nan, 3.0]})
+    actual = pd.DataFrame({'code': [None, None, 'c'], 'amount': [1.0, np.nan, 3.0]})
+    
+    result = NullValidation().validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'] == {'code': {'mismatched_rows': 2, 'rows_with_differences': [0, 2]}}
+
+def test_null_keeps_empty_strings_when_asked():
+    expected = pd.DataFrame({'code': ['']})
+    actual = pd.DataFrame({'code': [None]})
+    
+    result = NullValidation(treat_empty_as_null=False).validate(expected, actual)
+    
+    assert result['differences'] == {'code': {'mismatched_rows': 1, 'rows_with_differences': [0]}}
+
+def test_distribution_passes_similar_data():
+    expected = pd.DataFrame({'amount': [10.0, 20.0, 30.0]})
+    actual = pd.DataFrame({'amount': [10.1, 20.0, 29.9]})
+    
+    result = DistributionValidation(threshold_pct=5).validate(expected, actual)
+    
+    assert result == {'status': 'pass', 'differences': {}}
+
+def test_distribution_reports_shifted_statistics():
+    expected = pd.DataFrame({'amount': [10.0, 20.0, 30.0]})
+    actual = pd.DataFrame({'amount': [10.0, 20.0, 60.0]})
+    
+    result = DistributionValidation(threshold_pct=5).validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert sorted(result['differences']['amount']) == ['max', 'mean', 'std']
+    assert result['differences']['amount']['max']['difference_pct'] == 100.0
+
+def test_distribution_without_numeric_columns_passes():
+    frame = pd.DataFrame({'code': ['a', 'b']})
+    
+    result = DistributionValidation().validate(frame, frame.assign(code=['c', 'd']))
+    
+    assert result['status'] == 'pass'
+
+def test_pattern_passes_when_both_sides_match_alike():
+    expected = pd.DataFrame({'code': ['AB12', 'bad', None]})
+    actual = pd.DataFrame({'code': ['CD34', 'worse', None]})
+    
+    result = PatternValidation({'code': r'[A-Z]{2}\d{2}'}).validate(expected, actual)
+    
+    assert result == {'status': 'pass', 'differences': {}}
+
+def test_pattern_reports_invalid_values():
+    expected = pd.DataFrame({'code': ['AB12', 'CD34']})
+    actual = pd.DataFrame({'code': ['AB12', 'cd34']})
+    
+    result = PatternValidation({'code': r'[A-Z]{2}\d{2}'}).validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert result['differences'] == {'code': {'mismatched_rows': 1, 'invalid_values': {1: 'cd34'}}}
+
+def test_pattern_without_configured_columns_passes():
+    frame = pd.DataFrame({'code': ['a'], 'id': [1]})
+    
+    result = PatternValidation({'id': r'\d+', 'missing': 'x'}).validate(frame, frame.assign(code=['b']))
+    
+    assert result['status'] == 'pass'
+
+def test_composite_collects_failing_strategies():
+    expected = pd.DataFrame({'id': [1, 2], 'code': ['a', 'b']})
+    actual = pd.DataFrame({'id': [1, 3], 'code': ['a', 'b']})
+    composite = CompositeValidation([NumericValidation(0), CategoricalValidation()])
+    
+    result = composite.validate(expected, actual)
+    
+    assert result['status'] == 'fail'
+    assert list(result['differences']) == ['NumericValidation']
+    assert composite.validate(expected, expected.copy()) == {'status': 'pass', 'differences': {}}
+
+def test_composite_without_strategies_passes():
+    frame = pd.DataFrame({'id': [1]})
+    
+    result = CompositeValidation([]).validate(frame, frame.assign(id=[2]))
+    
+    assert result == {'status': 'pass', 'differences': {}}
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+from src.config.settings import DuckDBSettings
+from src.database.duckdb import DuckDBConnector
+from src.validation.strategies import CategoricalValidation, CompositeValidation, NullValidation, NumericValidation
+from src.validation.validator import DataValidator
+
+SOURCE_QUERY = "SELECT id, id * 1.5 AS amount, 'x' AS code FROM range(10) AS r(id)"
+
+def _duckdb(tmp_path, *statements):
+    connector = DuckDBConnector(DuckDBSettings(file_path=':memory:', download_path=str(tmp_path)))
+    connector.connect()
+    with connector.acquire() as connection:
+        for statement in statements:
+            connection.raw_sql(statement)
+    return connector
+
+@pytest.fixture
+def source(tmp_path):
+    connector = _duckdb(tmp_path)
+    yield connector
+    connector.close()
+
+@pytest.fixture
+def target(tmp_path):
+    # Same rows as SOURCE_QUERY, except id 3 (amount), id 4 (code) and a missing id 9
+    connector = _duckdb(
+        tmp_path,
+        f"CREATE TABLE orders AS {SOURCE_QUERY} WHERE id < 9",
+        "UPDATE orders SET amount = amount + 1 WHERE id = 3",
+        "UPDATE orders SET code = 'y' WHERE id = 4"
+    )
+    yield connector
+    connector.close()
+
+def test_validate_query_merges_differences_across_batches(source, target):
+    strategy = CompositeValidation([NumericValidation(0.5), CategoricalValidation()])
+    validator = DataValidator(source, target, strategy, batch_size=3)
+    
+    # amount is DECIMAL in DuckDB, which pandas only sees as objects
+    select = "SELECT id, CAST(amount AS DOUBLE) AS amount, code FROM"
+    
+    result = validator.validate_query(
+        f"{select} ({SOURCE_QUERY}) ORDER BY id", f"{select} orders ORDER BY id"
+    )
+    
+    assert result['status'] == 'fail'
+    assert (result['source_rows'], result['target_rows']) == (10, 9)
+    assert result['details']['NumericValidation'].values.tolist() == [[3, 'amount', 4.5, 5.5]]
+    assert result['details']['CategoricalValidation'].values.tolist() == [[4, 'code', 'x', 'y']]
+
+def test_validate_query_passes_identical_batches(source, target):
+    validator = DataValidator(source, target, NumericValidation(0), batch_size=4)
+    
+    result = validator.validate_query(
+        f"{SOURCE_QUERY} WHERE id < 3 ORDER BY id", "SELECT * FROM orders WHERE id < 3 ORDER BY id"
+    )
+    
+    assert result == {'status': 'pass', 'details': {}, 'source_rows': 3, 'target_rows': 3}
+
+def test_batches_with_drifting_dtypes_rebind_the_strategy(source, target):
+    validator = DataValidator(source, target, NumericValidation(0))
+    # An all-null first batch reads as objects, later ones as numbers
+    validate_batch = validator._compile(pd.DataFrame({'id': [None]}), pd.DataFrame({'id': [None]}))
+    
+    result = validate_batch(pd.DataFrame({'id': [1, 2]}), pd.DataFrame({'id': [1, 3]}))
+    
+    assert result['differences'].values.tolist() == [[1, 'id', 2, 3]]
+    assert validate_batch(pd.DataFrame({'id': [None]}), pd.DataFrame({'id': [None]}))['status'] == 'pass'
+
+def test_pushdown_exact_reports_rows_on_either_side(source, target):
+    validator = DataValidator(source, target, NumericValidation(0))
+    
+    result = validator.validate_query_pushdown(SOURCE_QUERY, "SELECT * FROM orders")
+    
+    assert result['status'] == 'fail'
+    assert (result['source_rows'], result['target_rows']) == (10, 9)
+    assert sorted(result['details']['missing_in_target']['id']) == [3, 4, 9]
+    assert sorted(result['details']['unexpected_in_target']['id']) == [3, 4]
+
+def test_pushdown_exact_passes_identical_data(source, target):
+    validator = DataValidator(source, target, NumericValidation(0))
+    
+    result = validator.validate_query_pushdown(
+        f"{SOURCE_QUERY} WHERE id < 3", "SELECT * FROM orders WHERE id < 3"
+    )
+    
+    assert result == {'status': 'pass', 'details': {}, 'source_rows': 3, 'target_rows': 3}
+
+def test_pushdown_numeric_reports_values_and_missing_keys(source, target):
+    validator = DataValidator(source, target, NumericValidation(0))
+    
+    result = validator.validate_query_pushdown(
+        SOURCE_QUERY, "SELECT * FROM orders", key_columns=['id'], tolerance=0.5
+    )
+    
+    assert result['status'] == 'fail'
+    assert result['details']['missing_in_target']['id'].tolist() == [9]
+    assert 'unexpected_in_target' not in result['details']
+    assert result['details']['differences'].values.tolist() == [[3, 'amount', 4.5, 5.5]]
+
+@pytest.mark.parametrize('batch_size', [3, 100])
+def test_null_report_does_not_depend_on_batch_size(tmp_path, batch_size):
+    connector = _duckdb(
+        tmp_path,
+        "CREATE TABLE a AS SELECT id, CASE WHEN id % 4 = 0 THEN NULL ELSE 'x' END AS code FROM range(10) AS r(id)",
+        "CREATE TABLE b AS SELECT id, CASE WHEN id IN (0, 7) THEN NULL ELSE 'x' END AS code FROM range(10) AS r(id)"
+    )
+    validator = DataValidator(connector, connector, NullValidation(), batch_size=batch_size)
+    
+    result = validator.validate_query("SELECT * FROM a ORDER BY id", "SELECT * FROM b ORDER BY id")
+    connector.close()
+    
+    assert result['details'] == {'code': {'mismatched_rows': 3, 'rows_with_differences': [4, 7, 8]}}